@@ -199,13 +199,14 @@ class Arduino:
                 xor ^= data_byte
             return [xor]
 
+        # Build the block once, it's re-sent unchanged on any retries
+        block = data + checksum()
         with SMBus(self._bus) as bus:
-            block = data + checksum()
             LOG.debug(f'sending "{block}" to I2C')
             try:
                 bus.write_i2c_block_data(i2c_addr=self._address,
                                          register=register,
-                                         data=data + checksum())
+                                         data=block)
             except IOError:
                 retries = 0
                 success = False
@@ -214,7 +215,7 @@ class Arduino:
                         sleep(0.02)
                         bus.write_i2c_block_data(i2c_addr=self._address,
                                                  register=register,
-                                                 data=data + checksum())
+                                                 data=block)
                         success = True
                     except IOError:
                         retries += 1
@@ -231,7 +232,7 @@ class Arduino:
 
     def _set_led_rgb(self, led: int = 0, red: float = 0, green: float = 0, blue: float = 0):
         assert led == 0
-        light_values = list([Arduino._check_byte(f * 255) for f in colorsys.rgb_to_hsv(red, blue, green)])
+        light_values = [Arduino._check_byte(f * 255) for f in colorsys.rgb_to_hsv(red, blue, green)]
         self._send(register=0x21, data=light_values)
 
     def set_motor_power(self, a, b, c):
@@ -249,7 +250,7 @@ class Arduino:
         Raw values from the three rotary encoders attached to the motors
         """
         data = self._read(register=0x22, bytes_to_read=6)
-        return list([a * 256 + b for a, b in zip(data[::2], data[1::2])])
+        return [a * 256 + b for a, b in zip(data[::2], data[1::2])]
 
 
 class P017LCD:
@@ -281,7 +282,7 @@ class P017LCD:
         strings which will be treated as rows. In our case we only have two rows!
         """
         if isinstance(new_text, str):
-            self._text = list(new_text[row * self._columns:self._columns] for row in range(self._rows))
+            self._text = [new_text[row * self._columns:self._columns] for row in range(self._rows)]
             self._update()
         elif isinstance(new_text, list):
             self._text = [''] * self._rows
@@ -1,6 +1,6 @@
-from math import degrees
+from math import degrees, sin, cos
 
-from approxeng.chassis import HoloChassis, DeadReckoning, rotate_vector, Motion
+from approxeng.chassis import HoloChassis, DeadReckoning, Motion
 from approxeng.chassis.dynamics import MotionLimit, RateLimit
 from approxeng.input import Controller
 from approxeng.task import Task
@@ -17,8 +17,10 @@ class ManualMotionTask(Task):
         super().__init__(name='manual_motion', resources=['arduino', 'display', 'joystick', 'chassis'])
         self.accel_time = accel_time
         self.bearing_zero = None
+        self.absolute_rotation = None
         self.max_trn = 0
         self.max_rot = 0
+        self.power_scale = None
         self.dead_reckoning = None
         ':type : '
         self.pose_display_interval = IntervalCheck(interval=0.2)
@@ -37,9 +39,13 @@ class ManualMotionTask(Task):
         # Cache maximum translation and rotation speeds from chassis calculations
         self.max_trn = world.chassis.get_max_translation_speed()
         self.max_rot = world.chassis.get_max_rotation_speed()
+        # Cache reciprocal of each wheel's maximum speed, used to turn wheel speeds into motor powers.
+        # Like max_trn and max_rot, manual_motion(..) relies on this having been set here
+        self.power_scale = [1.0 / wheel.maximum_rotation_per_second for wheel in world.chassis.wheels]
         # Set relative motion
         world.display.led0 = 'red'
         self.bearing_zero = None
+        self.absolute_rotation = None
         # Initialise dead reckoning
         self.dead_reckoning = DeadReckoning(chassis=world.chassis, counts_per_revolution=3310)
         # Set up motion limits, simulate slower response to avoid damaging
@@ -53,6 +59,19 @@ class ManualMotionTask(Task):
     def shutdown(self):
         pass
 
+    def update_absolute_rotation(self):
+        """
+        Recalculate the sine and cosine used to rotate the translation vector in absolute mode. This is the clockwise
+        rotation by (bearing_zero - orientation) that rotate_vector performs, so the pair holds sin and cos of the
+        negated angle. The angle only changes when the bearing zero or the dead reckoning pose changes, so rather than
+        recomputing on every tick this must be called after any change to bearing_zero or the dead reckoning pose.
+        """
+        if self.bearing_zero is None:
+            self.absolute_rotation = None
+        else:
+            angle = self.bearing_zero - self.dead_reckoning.pose.orientation
+            self.absolute_rotation = sin(-angle), cos(-angle)
+
     def tick(self, world):
         self.manual_motion(arduino=world.arduino, display=world.display,
                            joystick=world.joystick, chassis=world.chassis)
@@ -64,13 +83,16 @@ class ManualMotionTask(Task):
             # Set relative motion
             display.led0 = 'red'
             self.bearing_zero = None
+            self.update_absolute_rotation()
         elif 'square' in joystick.presses:
             # Set absolute motion
             display.led0 = 'lime'
             self.bearing_zero = self.dead_reckoning.pose.orientation
+            self.update_absolute_rotation()
         elif 'circle' in joystick.presses:
             # Reset dead reckoning orientation
             self.dead_reckoning.reset()
+            self.update_absolute_rotation()
         elif 'cross' in joystick.presses:
             # Cycle through limit modes
             self.limit_mode = (self.limit_mode + 1) % 3
@@ -78,6 +100,7 @@ class ManualMotionTask(Task):
         # Check to see whether the minimum interval between dead reckoning updates has passed
         if self.pose_update_interval.should_run():
             self.dead_reckoning.update_from_counts(arduino.encoder_values)
+            self.update_absolute_rotation()
 
         # Update the display if appropriate
         if self.pose_display_interval.should_run():
@@ -96,15 +119,16 @@ class ManualMotionTask(Task):
         # maximum translation speed, this will mean we go as fast directly forward
         # as possible when the stick is pushed fully forwards
 
-        translate = Vector2(
-            joystick.lx,
-            joystick.ly) * self.max_trn
-        ':type : euclid.Vector2'
+        trn_x = joystick.lx * self.max_trn
+        trn_y = joystick.ly * self.max_trn
 
         # If we're in absolute mode, rotate the translation vector appropriately
-        if self.bearing_zero is not None:
-            translate = rotate_vector(translate,
-                                      self.bearing_zero - self.dead_reckoning.pose.orientation)
+        if self.absolute_rotation is not None:
+            s, c = self.absolute_rotation
+            trn_x, trn_y = c * trn_x - s * trn_y, s * trn_x + c * trn_y
+
+        translate = Vector2(trn_x, trn_y)
+        ':type : euclid.Vector2'
 
         # Get the rotation in radians per second from the right hand stick's X axis,
         # scaling it to our maximum rotational speed. When standing still this means
@@ -128,7 +152,7 @@ class ManualMotionTask(Task):
         # then send the appropriate messages to the Syren10 controllers over its serial
         # line as well as lighting up a neopixel ring to provide additional feedback
         # and bling.
-        power = [speeds[i] / chassis.wheels[i].maximum_rotation_per_second for i in range(0, 3)]
+        power = [speed * scale for speed, scale in zip(speeds, self.power_scale)]
         if self.limit_mode == 1:
             power = self.rate_limit.limit_and_return(power)
         arduino.set_motor_power(power[0], power[1], power[2])